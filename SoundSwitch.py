@@ -1,17 +1,20 @@
 import sys
 import re
 import threading
+import time
 import uuid
 import subprocess
 import json
+import logging
 import os
+from collections import OrderedDict, defaultdict
 import autostart
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QListWidget, QLabel, QPushButton, QListWidgetItem, QMessageBox,
-    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QLineEdit,
+    QStyledItemDelegate, QStyle, QLineEdit,
     QComboBox, QMenu, QSystemTrayIcon, QAction, QDialog,
-    QSpinBox, QCheckBox, QSplitter, QSplitterHandle, QSlider,
+    QSpinBox, QCheckBox, QSplitter, QSplitterHandle, QSlider, QListView,
 )
 from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QFont, QIcon, QColor, QBrush, QPalette, QPainter, QPixmap, QPen, QPainterPath
@@ -25,13 +28,108 @@ try:
 except ImportError:
     DBUS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_log = logging.getLogger('soundswitch')
+
 STATE_FILE = 'routing_state.json'
 CUSTOM_SINKS = ['Game', 'Media', 'Chat', 'Aux']
 RNNOISE_LADSPA = '/usr/lib/ladspa/librnnoise_ladspa.so'
+# Sink listing; the JSON form needs pactl 16+, older ones get the short form
+SINKS_JSON_QUERY = ('-f', 'json', 'list', 'short', 'sinks')
+SINKS_SHORT_QUERY = ('list', 'short', 'sinks')
+# `pactl subscribe` facilities mapped to the cached queries their events make
+# stale; events that touch SNAPSHOT_QUERIES also refresh the UI
+FACILITY_QUERIES = {
+    'sink': (SINKS_JSON_QUERY, SINKS_SHORT_QUERY),
+    'sink-input': (('list', 'sink-inputs'),),
+    'source': (('list', 'sources'),),
+    'server': (('info',),),
+    'module': (('list', 'short', 'modules'),),
+}
+# pactl queries whose output makes up the state shown in the UI
+SNAPSHOT_QUERIES = (
+    SINKS_JSON_QUERY,
+    ('list', 'sink-inputs'),
+    ('list', 'sources'),
+    ('info',),
+)
+# Upper bound on how long a cached pactl query result is reused
+PACTL_CACHE_TTL = 5.0
+# Routine state changes are written to disk after this much idle time
+STATE_SAVE_DELAY_MS = 5000
+# Bursts of pactl events closer together than this collapse into one refresh
+EVENT_COALESCE_MS = 50
+# ...but a continuous burst still refreshes after at most this long
+EVENT_MAX_DELAY_MS = 250
+# Fallback polling: the interval doubles while nothing changes, up to the max
+POLL_INTERVAL_MS = 5000
+POLL_INTERVAL_MAX_MS = 20000
+# For a short while after a user action the fallback poll runs much faster,
+# so the follow-up changes it causes show up promptly
+POLL_BURST_INTERVAL_MS = 250
+POLL_BURST_MS = 1500
+# How long to wait before trying to re-establish a lost `pactl subscribe`
+PACTL_MONITOR_RETRY_MS = 30000
+_PACTL_EVENT_RE = re.compile(r"Event '[\w-]+' on ([\w-]+)")
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^a-zA-Z0-9]')
+_VOLUME_PERCENT_RE = re.compile(r'(\d+)%')
+# Index and name columns of `pactl list short ...` output
+_SHORT_LIST_RE = re.compile(r'^(\d+)\t([^\t\n]+)', re.MULTILINE)
+# Index, name and argument columns of `pactl list short modules` output
+_SHORT_MODULES_RE = re.compile(r'^(\d+)\t([^\t\n]+)(?:\t([^\t\n]*))?', re.MULTILINE)
+# The `pactl list sink-inputs` fields get_sink_inputs() uses, one match per line
+_SINK_INPUT_FIELDS_RE = re.compile(
+    r'^\s*(?:Sink Input #(\d+)|Sink: (\d+)|application\.name = "(.*)"|media\.name = "(.*)")\s*$',
+    re.MULTILINE,
+)
+_DEFAULT_SINK_RE = re.compile(r'^Default Sink:(.*)$', re.MULTILINE)
+# Client names of the sound server's own loopback streams
+_LOOPBACK_APP_NAMES = frozenset({'pipewire', 'pulseaudio'})
+# Item data role holding a stream's pre-encoded drag payload
+MIME_PAYLOAD_ROLE = Qt.UserRole + 2
+# Row size hints kept per delegate; rows for departed streams age out
+SIZE_HINT_CACHE_SIZE = 512
+# Rendered drag pixmaps kept per streams list
+DRAG_PIXMAP_CACHE_SIZE = 64
+# Shared colors and brushes for list rows, built once instead of per paint/row
+BG_DEFAULT = QColor('#003366')
+BRD_DEFAULT = QColor('#00bfff')
+BG_SELECTED_HIGHLIGHT = QColor('#00bfff')
+BG_SELECTED = QColor('#005f87')
+BRD_SELECTED = QColor('#fff')
+BG_HOVER = QColor('#2d4157')
+BRD_ROW = QColor('#444')
+TEXT_MAIN = QColor('#f0f0f0')
+TEXT_SUB = QColor('#b0b0b0')
+BG_EVEN = QColor('#232629')
+BG_ODD = QColor('#2d2f31')
+BRUSH_EVEN = QBrush(BG_EVEN)
+BRUSH_ODD = QBrush(BG_ODD)
+BRUSH_ACCENT = QBrush(QColor('#00bfff'))
+BRUSH_PLACEHOLDER = QBrush(QColor('#555'))
+BRUSH_DIM = QBrush(QColor('#888'))
+ALIGN_TOP_LEFT = Qt.AlignTop | Qt.AlignLeft
+
+def _json_loads(text):
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+def _json_dumps_state(state):
+    """Serialise state as indented JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # Loopback module ids are int keys; json.dumps turns those into strings
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(state, indent=2)
+
 
 def _safe_mic_id(mic_name):
     """Return a PipeWire-safe sink name component derived from a source name."""
-    safe = re.sub(r'[^a-zA-Z0-9]', '_', mic_name)
+    safe = _UNSAFE_NAME_CHARS_RE.sub('_', mic_name)
     if len(safe) <= 30:
         return safe
     # Keep last 6 chars so profiles of the same device stay unique (e.g. mono vs stereo suffixes)
@@ -46,7 +144,34 @@ class DraggableListWidget(QListWidget):
         self.setAlternatingRowColors(True)
         self.setSelectionMode(QListWidget.SingleSelection)
         self.setContentsMargins(0, 0, 0, 0)
-        self.setStyleSheet('QListWidget { padding: 8px; }')
+        self.setObjectName('panelList')
+        self._drag_pixmaps = OrderedDict()  # (text, subtitle, size, state) -> drag pixmap, oldest first
+        # Index of the stream being dragged, captured when the drag starts;
+        # the current row can change while the drag's event loop runs
+        self.drag_stream_index = None
+
+    def _drag_pixmap(self, item):
+        """Render the row through its delegate once, instead of letting Qt grab the view per drag."""
+        size = self.visualItemRect(item).size()
+        option = self.viewOptions()
+        option.rect = QtCore.QRect(QtCore.QPoint(0, 0), size)
+        option.state |= QStyle.State_Selected
+        data = item.data(Qt.UserRole + 1)
+        sub_text = data.get('sub', '') if isinstance(data, dict) else ''
+        key = (item.text(), sub_text, size.width(), size.height(), int(option.state))
+        pix = self._drag_pixmaps.get(key)
+        if pix is not None:
+            self._drag_pixmaps.move_to_end(key)
+        else:
+            pix = QPixmap(size)
+            pix.fill(Qt.transparent)
+            painter = QPainter(pix)
+            self.itemDelegate().paint(painter, option, self.indexFromItem(item))
+            painter.end()
+            self._drag_pixmaps[key] = pix
+            if len(self._drag_pixmaps) > DRAG_PIXMAP_CACHE_SIZE:
+                self._drag_pixmaps.popitem(last=False)
+        return pix
 
     def startDrag(self, supportedActions):
         item = self.currentItem()
@@ -54,9 +179,19 @@ class DraggableListWidget(QListWidget):
             drag = QtGui.QDrag(self)
             mime = QtCore.QMimeData()
             mime.setText(item.text())
-            mime.setData('application/x-sink-input-index', str(item.data(Qt.ItemDataRole.UserRole)).encode())
+            payload = item.data(MIME_PAYLOAD_ROLE)
+            if payload is None:
+                payload = str(item.data(Qt.ItemDataRole.UserRole)).encode()
+            mime.setData('application/x-sink-input-index', payload)
             drag.setMimeData(mime)
-            drag.exec_(Qt.DropAction.MoveAction)
+            pix = self._drag_pixmap(item)
+            drag.setPixmap(pix)
+            drag.setHotSpot(QtCore.QPoint(10, pix.height() // 2))
+            self.drag_stream_index = item.data(Qt.ItemDataRole.UserRole)
+            try:
+                drag.exec_(Qt.DropAction.MoveAction)
+            finally:
+                self.drag_stream_index = None
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasFormat('application/x-sink-input-index'):
@@ -82,7 +217,7 @@ class SinkDropListWidget(QListWidget):
         self.setAlternatingRowColors(True)
         self.setSelectionMode(QListWidget.SingleSelection)
         self.setContentsMargins(0, 0, 0, 0)
-        self.setStyleSheet('QListWidget { padding: 8px; }')
+        self.setObjectName('sinkList')
         self._drag_over_row = None
 
     def dragEnterEvent(self, event):
@@ -99,7 +234,16 @@ class SinkDropListWidget(QListWidget):
 
     def dropEvent(self, event):
         if event.mimeData().hasFormat('application/x-sink-input-index'):
-            sink_input_index = bytes(event.mimeData().data('application/x-sink-input-index')).decode()
+            source = event.source()
+            if isinstance(source, DraggableListWidget) and source.drag_stream_index is not None:
+                # Drag from our own streams list: use the index it captured at drag start
+                sink_input_index = source.drag_stream_index
+            else:
+                try:
+                    sink_input_index = int(bytes(event.mimeData().data('application/x-sink-input-index')))
+                except ValueError:
+                    event.ignore()
+                    return
             self.move_sink_input_callback(sink_input_index, self.sink_name)
             event.acceptProposedAction()
         else:
@@ -109,14 +253,32 @@ class SinkDropListWidget(QListWidget):
         super().dragLeaveEvent(event)
 
 class RoundedBoxDelegate(QStyledItemDelegate):
+    # Minimum row heights, without and with a subtitle line
+    ITEM_H = 36
+    ITEM_H_SUB = 48
+
     def __init__(self, highlight_selected=False, default_sink_name=None, padding=10, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.highlight_selected = highlight_selected
         self.default_sink_name = default_sink_name
         self.padding = padding
+        # sizeHint results keyed by (display text, has subtitle, font), least
+        # recently used first; the base hint needs font metrics, and views ask
+        # again on every resize and relayout
+        self._size_hints = OrderedDict()
+        # Title and subtitle fonts, configured once instead of on every paint
+        self._font_main = QFont()
+        self._font_main.setPointSize(10)
+        self._font_sub = QFont()
+        self._font_sub.setPointSize(8)
+        self._font_sub.setItalic(True)
 
     def paint(self, painter, option, index):
-        painter.save()
+        # Restore only the painter state changed below rather than save()/restore()
+        old_pen = painter.pen()
+        old_brush = painter.brush()
+        old_font = painter.font()
+        old_antialias = painter.testRenderHint(QPainter.Antialiasing)
         rect = option.rect.adjusted(4, 4, -4, -4)
         radius = 10
         # Get main and subtitle text
@@ -133,47 +295,82 @@ class RoundedBoxDelegate(QStyledItemDelegate):
             is_default = True
         # Background and border color
         if is_default:
-            bg = QColor('#003366')
-            border = QColor('#00bfff')
+            bg = BG_DEFAULT
+            border = BRD_DEFAULT
         elif option.state & QStyle.State_Selected and self.highlight_selected:
-            bg = QColor('#00bfff')
-            border = QColor('#fff')
+            bg = BG_SELECTED_HIGHLIGHT
+            border = BRD_SELECTED
         elif option.state & QStyle.State_Selected:
-            bg = QColor('#005f87')
-            border = QColor('#fff')
+            bg = BG_SELECTED
+            border = BRD_SELECTED
         elif option.state & QStyle.State_MouseOver:
-            bg = QColor('#2d4157')
-            border = QColor('#444')
+            bg = BG_HOVER
+            border = BRD_ROW
         else:
-            bg = QColor('#232629') if index.row() % 2 == 0 else QColor('#2d2f31')
-            border = QColor('#444')
+            bg = BG_EVEN if index.row() % 2 == 0 else BG_ODD
+            border = BRD_ROW
         # Draw rounded rect
-        painter.setRenderHint(painter.Antialiasing)
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setBrush(bg)
         painter.setPen(border)
         painter.drawRoundedRect(rect, radius, radius)
         # Draw main text
-        painter.setPen(QColor('#f0f0f0'))
-        font = option.font
-        font.setPointSize(10)
-        painter.setFont(font)
-        painter.drawText(rect.adjusted(self.padding, 2, -self.padding, -2), Qt.AlignTop | Qt.AlignLeft, main_text)
+        painter.setPen(TEXT_MAIN)
+        painter.setFont(self._font_main)
+        painter.drawText(rect.adjusted(self.padding, 2, -self.padding, -2), ALIGN_TOP_LEFT, main_text)
         # Draw subtitle (media name)
         if sub_text:
-            font.setPointSize(8)
-            font.setItalic(True)
-            painter.setFont(font)
-            painter.setPen(QColor('#b0b0b0'))
-            painter.drawText(rect.adjusted(self.padding, 20, -self.padding, -2), Qt.AlignTop | Qt.AlignLeft, sub_text)
-        painter.restore()
+            painter.setFont(self._font_sub)
+            painter.setPen(TEXT_SUB)
+            painter.drawText(rect.adjusted(self.padding, 20, -self.padding, -2), ALIGN_TOP_LEFT, sub_text)
+        painter.setPen(old_pen)
+        painter.setBrush(old_brush)
+        painter.setFont(old_font)
+        painter.setRenderHint(QPainter.Antialiasing, old_antialias)
 
     def sizeHint(self, option, index):
-        base = super().sizeHint(option, index)
-        # If subtitle present, make it taller
         data = index.data(Qt.UserRole + 1)
-        if data and isinstance(data, dict) and data.get('sub'):
-            return base.expandedTo(QtCore.QSize(base.width(), 48))
-        return base.expandedTo(QtCore.QSize(base.width(), 36))
+        has_sub = bool(data and isinstance(data, dict) and data.get('sub'))
+        # The base hint depends on the font, so a font or style change misses
+        key = (index.data(Qt.DisplayRole), has_sub, option.font.key())
+        hint = self._size_hints.get(key)
+        if hint is not None:
+            self._size_hints.move_to_end(key)
+        else:
+            base = super().sizeHint(option, index)
+            # If subtitle present, make it taller
+            hint = base.expandedTo(QtCore.QSize(base.width(), self.ITEM_H_SUB if has_sub else self.ITEM_H))
+            self._size_hints[key] = hint
+            if len(self._size_hints) > SIZE_HINT_CACHE_SIZE:
+                self._size_hints.popitem(last=False)
+        return QtCore.QSize(hint)
+
+
+class RulesListModel(QtCore.QAbstractListModel):
+    """Read-only model listing the auto-routing rules; replaced wholesale with one model reset
+    when they change."""
+
+    def __init__(self, rules=(), parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self.set_rules(rules)
+
+    def set_rules(self, rules):
+        rows = [f"If app is '{rule['app_name']}' → {rule['sink']}" for rule in rules]
+        if rows == self._rows:
+            # Unchanged (the common case on refresh); keep the view and selection as they are
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._rows[index.row()]
+        return None
 
 
 class VolumeOSD(QWidget):
@@ -329,8 +526,7 @@ class OSDSettingsDialog(QDialog):
         pos_row = QHBoxLayout()
         pos_row.addWidget(QLabel('Position:'))
         self._pos_combo = QComboBox()
-        for label, _ in self.POSITIONS:
-            self._pos_combo.addItem(label)
+        self._pos_combo.addItems([label for label, _ in self.POSITIONS])
         current_pos = self.state.get('osd_position', 'bottom-right')
         keys = [k for _, k in self.POSITIONS]
         if current_pos in keys:
@@ -625,15 +821,15 @@ class GlobalShortcutsManager(QtCore.QObject):
     @staticmethod
     def _strip_version(shortcut_id):
         """Remove _vN suffix: 'Game_up_v2' -> 'Game_up'."""
-        parts = shortcut_id.rsplit('_v', 1)
-        if len(parts) == 2 and parts[1].isdigit():
-            return parts[0]
+        base, sep, version = shortcut_id.rpartition('_v')
+        if sep and version.isdigit():
+            return base
         return shortcut_id
 
     def _description(self, key_id):
         """Return human-readable description for a shortcut ID (no version suffix)."""
         clean = self._strip_version(key_id)
-        sink, direction = clean.split('_', 1)
+        sink, _, direction = clean.partition('_')
         arrow = '\u2191' if direction == 'up' else '\u2193'
         return f'{sink} Volume {arrow} {direction.title()}'
 
@@ -679,6 +875,66 @@ class GlobalShortcutsManager(QtCore.QObject):
             self._glib_loop.quit()
 
 
+class PactlQueryWorker(QtCore.QRunnable):
+    """Runs read-only pactl queries on a thread-pool thread.
+
+    Emits notifier.finished with (generation, {argv tuple: stdout}); queries that
+    fail are left out so the GUI thread can rerun them and report the error."""
+
+    def __init__(self, queries, generation, notifier):
+        super().__init__()
+        self.queries = queries
+        self.generation = generation
+        self.notifier = notifier
+
+    def run(self):
+        # Start every query before waiting on any so their round-trips overlap
+        procs = []
+        for args in self.queries:
+            try:
+                proc = subprocess.Popen(['pactl', *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            except OSError:
+                continue
+            procs.append((args, proc))
+        results = {}
+        for args, proc in procs:
+            stdout, _ = proc.communicate()
+            if proc.returncode == 0:
+                results[tuple(args)] = stdout
+        self.notifier.finished.emit(self.generation, results)
+
+
+class PactlQueryNotifier(QtCore.QObject):
+    finished = QtCore.pyqtSignal(int, object)
+
+
+class StateWriter(QtCore.QRunnable):
+    """Writes serialised state to path on a thread-pool thread.
+
+    Writes to a temporary file and renames it over the old one so a crash
+    mid-write cannot leave a truncated state file behind. Emits
+    notifier.failed with the error message if the write fails."""
+
+    def __init__(self, path, data, notifier):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.notifier = notifier
+
+    def run(self):
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.notifier.failed.emit(str(e))
+
+
+class StateWriteNotifier(QtCore.QObject):
+    failed = QtCore.pyqtSignal(str)
+
+
 def create_app_icon():
     """Create a programmatic speaker-with-soundwaves icon in the app's cyan-on-dark colour scheme."""
     size = 64
@@ -754,13 +1010,34 @@ class MainWindow(QMainWindow):
         self.tray_icon = None
         self.tray_menu = None
         self.is_hidden_to_tray = False
+        self._saved_state = None  # JSON text last written to STATE_FILE
+        self._status_error = None  # whether the status bar is styled as an error
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(STATE_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_state)
+        # State is written on its own single-thread pool so writes stay in order
+        # and never block the GUI thread
+        self._state_write_pool = QtCore.QThreadPool(self)
+        self._state_write_pool.setMaxThreadCount(1)
+        self._state_write_notifier = StateWriteNotifier(self)
+        self._state_write_notifier.failed.connect(self._on_state_write_failed)
+        # Safety net so a pending save is not lost if the app quits another way
+        QApplication.instance().aboutToQuit.connect(self.flush_state)
+        # User actions that change several things in a row share one UI rebuild
+        self._ui_refresh_timer = QTimer(self)
+        self._ui_refresh_timer.setSingleShot(True)
+        self._ui_refresh_timer.setInterval(EVENT_COALESCE_MS)
+        self._ui_refresh_timer.timeout.connect(lambda: self.refresh_devices_and_sinks(force=True))
         self.state = self.load_state()
         if 'rules' not in self.state:
             self.state['rules'] = [
                 {'app_name': 'Firefox', 'sink': 'Aux'}
             ]
-        if 'manual_overrides' not in self.state:
-            self.state['manual_overrides'] = {}
+        # Stream indices are ints in memory; JSON hands the override keys back as strings
+        self.state['manual_overrides'] = {
+            int(idx): sink for idx, sink in self.state.get('manual_overrides', {}).items()
+        }
         if 'volume_step' not in self.state:
             self.state['volume_step'] = 5
         if 'shortcut_version' not in self.state:
@@ -770,6 +1047,24 @@ class MainWindow(QMainWindow):
         if 'osd_duration' not in self.state:
             self.state['osd_duration'] = 3
         self._last_snapshot = None
+        self._last_raw_snapshot = None  # hash of the raw snapshot query output
+        # Swapped for the short sink listing if pactl has no JSON output
+        self._sinks_query = SINKS_JSON_QUERY
+        self._snapshot_queries = SNAPSHOT_QUERIES
+        self._list_items = {}  # list widget -> {row key: (item, row data)}
+        self._input_source_descriptions = {}  # source name -> description, as last shown
+        # Fonts used for list rows, built once rather than on every refresh
+        self._default_output_font = QFont('', 10, QFont.Bold)
+        self._nc_source_font = self._italic_font()
+        self._pactl_cache = {}  # argv tuple -> (timestamp, stdout)
+        self._parsed_cache = {}  # argv tuple -> (stdout, parsed result)
+        self._cache_generation = 0  # bumped on every invalidation
+        self._invalidated_at = {}  # argv tuple -> generation it was last dropped at
+        self._all_invalidated_at = 0  # generation of the last full invalidation
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._rule_map = None  # built from state['rules'] on first use
+        self._panels_stale = False  # a refresh was skipped while hidden
         self.hidden_sinks = set(CUSTOM_SINKS)
         self.hidden_streams = set()  # Will be populated with loopback stream indices
         self.init_ui()
@@ -779,13 +1074,24 @@ class MainWindow(QMainWindow):
             self.setGeometry(w['x'], w['y'], w['width'], w['height'])
         else:
             self.resize(1000, 600)
-        self.ensure_custom_sinks()
-        self.restore_routing_state()
-        self.refresh_devices_and_sinks(force=True)
-        # Auto-refresh every 2 seconds
+        # Refreshes are driven by `pactl subscribe` events; polling only
+        # runs if the subscription cannot be started.
         self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.conditional_refresh)
-        self.refresh_timer.start(2000)
+        self.refresh_timer.timeout.connect(self._on_poll_timer)
+        self._poll_burst_until = 0.0
+        self._event_refresh_timer = QTimer(self)
+        self._event_refresh_timer.setSingleShot(True)
+        self._event_refresh_timer.setInterval(EVENT_COALESCE_MS)
+        self._event_refresh_timer.timeout.connect(self._request_snapshot)
+        self._event_burst_start = 0.0  # when the pending event burst began
+        # Snapshot queries run on a worker thread so pactl never blocks the UI
+        self._query_notifier = PactlQueryNotifier(self)
+        self._query_notifier.finished.connect(self._on_snapshot_fetched)
+        self._snapshot_pending = False
+        self._pactl_monitor = None
+        # Talking to the sound server waits for the event loop, so the window
+        # (or tray icon) appears without waiting on pactl round-trips.
+        QTimer.singleShot(0, self._start_audio)
         # Dark theme palette
         self.apply_dark_theme()
         self.statusBar().showMessage('Ready')
@@ -834,7 +1140,13 @@ class MainWindow(QMainWindow):
         dark_palette.setColor(QPalette.Highlight, QColor('#005f87'))
         dark_palette.setColor(QPalette.HighlightedText, QColor('#ffffff'))
         self.setPalette(dark_palette)
-        self.setStyleSheet('QStatusBar { background: #232629; color: #f0f0f0; } QLabel { color: #f0f0f0; } QPushButton { background: #2d2f31; color: #f0f0f0; border: 1px solid #444; border-radius: 4px; padding: 4px 8px; } QPushButton:hover { background: #005f87; color: #fff; }')
+        # Panel widgets are styled by object name here, once, rather than each
+        # carrying its own style sheet.
+        self.setStyleSheet(
+            'QStatusBar { background: #232629; color: #f0f0f0; } QLabel { color: #f0f0f0; } QPushButton { background: #2d2f31; color: #f0f0f0; border: 1px solid #444; border-radius: 4px; padding: 4px 8px; } QPushButton:hover { background: #005f87; color: #fff; }'
+            ' QLabel#panelHeader { margin-bottom: 8px; } QLabel#sectionHeader { margin-bottom: 4px; } QLabel#sinkHeader { margin: 0px; padding: 0px; }'
+            ' QListWidget#panelList { padding: 8px; } QListView#rulesList { padding: 4px; } QListWidget#sinkList { margin: 0px; padding: 0px; border: none; }'
+        )
 
     def _italic_font(self):
         f = self.font()
@@ -842,17 +1154,28 @@ class MainWindow(QMainWindow):
         return f
 
     def show_status(self, message, error=False):
-        bar = self.statusBar() if hasattr(self, 'statusBar') else None
-        if bar:
+        self._show_status_message(message, 4000, error)
+
+    def _show_status_message(self, message, timeout, error=False):
+        bar = self.statusBar()
+        # Only reinstall the style sheet when the colour actually changes
+        if error != self._status_error:
             bar.setStyleSheet('color: #ff3333;' if error else 'color: #f0f0f0;')
-            bar.showMessage(message, 4000)
+            self._status_error = error
+        bar.showMessage(message, timeout)
+
+    def update_status_bar(self, sinks=None, sink_inputs=None, default_sink=None):
+        """Update the status bar with current system state
 
-    def update_status_bar(self):
-        """Update the status bar with current system state"""
+        Callers that already hold the current sinks, streams or default sink
+        pass them in; anything missing is queried."""
         try:
-            sinks = self.get_sinks()
-            sink_inputs = self.get_sink_inputs()
-            default_sink = self.get_default_sink_name()
+            if sinks is None:
+                sinks = self.get_sinks()
+            if sink_inputs is None:
+                sink_inputs = self.get_sink_inputs()
+            if default_sink is None:
+                default_sink = self.get_default_sink_name()
             
             # Count active streams
             active_streams = len([s for s in sink_inputs if s['index'] not in self.hidden_streams])
@@ -874,20 +1197,22 @@ class MainWindow(QMainWindow):
             status_message = " | ".join(status_parts)
             
             # Update status bar
-            bar = self.statusBar() if hasattr(self, 'statusBar') else None
-            if bar:
-                bar.setStyleSheet('color: #f0f0f0;')
-                bar.showMessage(status_message, 0)  # 0 = permanent message
+            self._show_status_message(status_message, 0)  # 0 = permanent message
                 
         except Exception as e:
             # If there's an error, show a simple status
-            bar = self.statusBar() if hasattr(self, 'statusBar') else None
-            if bar:
-                bar.setStyleSheet('color: #ff3333;')
-                bar.showMessage(f"Status update error: {str(e)}", 5000)
+            self._show_status_message(f"Status update error: {str(e)}", 5000, error=True)
 
     def conditional_refresh(self):
-        # Only refresh UI if state has changed
+        # Only refresh UI if state has changed. Identical pactl output means
+        # nothing can have changed, so skip parsing it altogether.
+        raw_snapshot = hash(tuple(self.query_pactl(list(args)) for args in self._snapshot_queries))
+        if raw_snapshot == self._last_raw_snapshot:
+            _log.debug('pactl state unchanged, skipping refresh (cache hits %d, misses %d)',
+                       self._cache_hits, self._cache_misses)
+            self._back_off_poll_interval()
+            return
+        self._last_raw_snapshot = raw_snapshot
         sinks = self.get_sinks()
         sink_inputs = self.get_sink_inputs()
         input_sources = self.get_input_sources()
@@ -924,6 +1249,126 @@ class MainWindow(QMainWindow):
         if snapshot != self._last_snapshot:
             self.refresh_devices_and_sinks(force=True)
             self._last_snapshot = snapshot
+            self._reset_poll_interval()
+        else:
+            self._back_off_poll_interval()
+
+    def _start_audio(self):
+        self._detect_sinks_query()
+        self.ensure_custom_sinks()
+        self.restore_routing_state()
+        self.refresh_devices_and_sinks(force=True)
+        self._start_pactl_monitor()
+
+    def _start_pactl_monitor(self):
+        proc = QtCore.QProcess(self)
+        proc.readyReadStandardOutput.connect(self._on_pactl_events)
+        self._pactl_monitor = proc
+        proc.start('pactl', ['subscribe'])
+        if not proc.waitForStarted(1000):
+            self._pactl_monitor = None
+            proc.deleteLater()
+            self._fall_back_to_polling()
+            return
+        proc.finished.connect(self._on_pactl_monitor_finished)
+        if self.refresh_timer.isActive():
+            # Resubscribed after falling back to polling; anything since the
+            # last poll went unseen, so resync instead of waiting for an event
+            self.refresh_timer.stop()
+            self.invalidate_pactl_cache()
+            self._request_snapshot()
+
+    def _on_pactl_monitor_finished(self):
+        # pipewire-pulse restarted or went away; poll until we can resubscribe
+        self._pactl_monitor.deleteLater()
+        self._pactl_monitor = None
+        self._fall_back_to_polling()
+
+    def _fall_back_to_polling(self):
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(POLL_INTERVAL_MS)
+        QTimer.singleShot(PACTL_MONITOR_RETRY_MS, self._start_pactl_monitor)
+
+    def _on_pactl_events(self):
+        proc = self._pactl_monitor
+        if proc is None:
+            return
+        stale = set()
+        while proc.canReadLine():
+            line = bytes(proc.readLine()).decode(errors='replace')
+            match = _PACTL_EVENT_RE.match(line)
+            if match:
+                stale.update(FACILITY_QUERIES.get(match.group(1), ()))
+        if stale:
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug('pactl events invalidated: %s', ', '.join(' '.join(key) for key in sorted(stale)))
+            # Only the queries for the facilities that changed are refetched
+            self.invalidate_pactl_cache(stale)
+            if not stale.isdisjoint(self._snapshot_queries):
+                now = time.monotonic()
+                if not self._event_refresh_timer.isActive():
+                    self._event_burst_start = now
+                if now - self._event_burst_start < EVENT_MAX_DELAY_MS / 1000:
+                    # Restarting the single-shot timer coalesces event bursts
+                    self._event_refresh_timer.start()
+
+    def _on_poll_timer(self):
+        self.invalidate_pactl_cache()
+        self._request_snapshot()
+
+    def _request_snapshot(self):
+        """Fetch SNAPSHOT_QUERIES in the background, then run conditional_refresh()."""
+        if self._snapshot_pending:
+            # The fetch in flight picks up whatever was invalidated meanwhile
+            return
+        now = time.monotonic()
+        queries = [key for key in self._snapshot_queries if not self._cache_fresh(key, now)]
+        if not queries:
+            self.conditional_refresh()
+            return
+        self._snapshot_pending = True
+        QtCore.QThreadPool.globalInstance().start(
+            PactlQueryWorker(queries, self._cache_generation, self._query_notifier)
+        )
+
+    def _on_snapshot_fetched(self, generation, results):
+        self._snapshot_pending = False
+        now = time.monotonic()
+        for key, output in results.items():
+            # A query invalidated while it ran may predate the change; drop
+            # just that result and keep the rest
+            if not self._invalidated_since(key, generation):
+                self._pactl_cache[key] = (now, output)
+        if any(self._invalidated_since(key, generation) and not self._cache_fresh(key, now)
+               for key in self._snapshot_queries):
+            # Refetch through the event timer so bursts stay coalesced and capped
+            if not self._event_refresh_timer.isActive():
+                self._event_burst_start = now
+                self._event_refresh_timer.start()
+            return
+        self.conditional_refresh()
+
+    def _back_off_poll_interval(self):
+        if not self.refresh_timer.isActive() or time.monotonic() < self._poll_burst_until:
+            return
+        if not self.isVisible():
+            # Nobody is looking; routing rules still run, just less often
+            self.refresh_timer.setInterval(POLL_INTERVAL_MAX_MS)
+        else:
+            # A finished burst leaves the short burst interval behind; never
+            # back off from below the base interval
+            interval = max(self.refresh_timer.interval() * 2, POLL_INTERVAL_MS)
+            self.refresh_timer.setInterval(min(interval, POLL_INTERVAL_MAX_MS))
+
+    def _reset_poll_interval(self):
+        if self.refresh_timer.isActive() and time.monotonic() >= self._poll_burst_until:
+            self.refresh_timer.setInterval(POLL_INTERVAL_MS)
+
+    def _burst_poll_interval(self):
+        """Poll quickly for POLL_BURST_MS after a user action."""
+        if self.refresh_timer.isActive():
+            self._poll_burst_until = time.monotonic() + POLL_BURST_MS / 1000
+            self.refresh_timer.start(POLL_BURST_INTERVAL_MS)
 
     def init_ui(self):
         # Left panel: vertical splitter — streams (top) / rules (bottom)
@@ -934,13 +1379,17 @@ class MainWindow(QMainWindow):
         streams_layout.setContentsMargins(0, 0, 0, 0)
         devices_label = QLabel('Application Streams')
         devices_label.setFont(QFont('', 12, QFont.Bold))
-        devices_label.setStyleSheet('margin-bottom: 8px;')
+        devices_label.setObjectName('panelHeader')
+        # One delegate per configuration, shared by every list that uses it;
+        # only the outputs list needs its own for the default-sink highlight
+        self._list_delegate = RoundedBoxDelegate(parent=self)
+        self._sink_delegate = RoundedBoxDelegate(padding=12, parent=self)
         self.devices_list = DraggableListWidget()
-        self.devices_list.setItemDelegate(RoundedBoxDelegate())
+        self.devices_list.setItemDelegate(self._list_delegate)
         self.devices_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.devices_list.customContextMenuRequested.connect(self.show_stream_context_menu)
         self.refresh_btn = QPushButton('Refresh')
-        self.refresh_btn.clicked.connect(lambda: self.refresh_devices_and_sinks(force=True))
+        self.refresh_btn.clicked.connect(self._on_refresh_clicked)
         streams_layout.addWidget(devices_label)
         streams_layout.addWidget(self.devices_list)
         streams_layout.addWidget(self.refresh_btn)
@@ -950,11 +1399,13 @@ class MainWindow(QMainWindow):
         rules_layout.setContentsMargins(0, 0, 0, 0)
         rules_label = QLabel('Auto-Routing Rules')
         rules_label.setFont(QFont('', 11, QFont.Bold))
-        rules_label.setStyleSheet('margin-bottom: 4px;')
-        self.rules_list = QListWidget()
+        rules_label.setObjectName('sectionHeader')
+        self._rules_model = RulesListModel(self.state['rules'], self)
+        self.rules_list = QListView()
+        self.rules_list.setModel(self._rules_model)
         self.rules_list.setAlternatingRowColors(True)
-        self.rules_list.setSelectionMode(QListWidget.SingleSelection)
-        self.rules_list.setStyleSheet('QListWidget { padding: 4px; }')
+        self.rules_list.setSelectionMode(QListView.SingleSelection)
+        self.rules_list.setObjectName('rulesList')
         rule_controls = QHBoxLayout()
         self.rule_app_input = QLineEdit()
         self.rule_app_input.setPlaceholderText('App name (e.g. Firefox)')
@@ -982,7 +1433,7 @@ class MainWindow(QMainWindow):
         center_layout.setSpacing(0)
         sinks_label = QLabel('Audio Sinks')
         sinks_label.setFont(QFont('', 12, QFont.Bold))
-        sinks_label.setStyleSheet('margin-bottom: 4px;')
+        sinks_label.setObjectName('sectionHeader')
         center_layout.addWidget(sinks_label)
 
         self._splitter_center = StyledSplitter(Qt.Vertical)
@@ -995,11 +1446,10 @@ class MainWindow(QMainWindow):
             label = QLabel(sink)
             label.setAlignment(Qt.AlignCenter)
             label.setFont(QFont('', 11, QFont.Bold))
-            label.setStyleSheet('margin: 0px; padding: 0px;')
+            label.setObjectName('sinkHeader')
             pane_layout.addWidget(label)
             sink_list = SinkDropListWidget(sink, self.move_sink_input)
-            sink_list.setItemDelegate(RoundedBoxDelegate(padding=12))
-            sink_list.setStyleSheet('QListWidget { margin: 0px; padding: 0px; border: none; }')
+            sink_list.setItemDelegate(self._sink_delegate)
             pane.setMinimumHeight(80)
             sink_list.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
             pane_layout.addWidget(sink_list)
@@ -1016,13 +1466,13 @@ class MainWindow(QMainWindow):
         outputs_panel.setContentsMargins(0, 0, 0, 0)
         outputs_label = QLabel('Output Devices')
         outputs_label.setFont(QFont('', 12, QFont.Bold))
-        outputs_label.setStyleSheet('margin-bottom: 8px;')
+        outputs_label.setObjectName('panelHeader')
         self.outputs_list = QListWidget()
         self.outputs_list.setAlternatingRowColors(True)
         self.outputs_list.setSelectionMode(QListWidget.SingleSelection)
         self.outputs_list.setContentsMargins(0, 0, 0, 0)
-        self.outputs_list.setStyleSheet('QListWidget { padding: 8px; }')
-        self.outputs_delegate = RoundedBoxDelegate(highlight_selected=True, default_sink_name=self.get_default_sink_name())
+        self.outputs_list.setObjectName('panelList')
+        self.outputs_delegate = RoundedBoxDelegate(highlight_selected=True)
         self.outputs_list.setItemDelegate(self.outputs_delegate)
         outputs_panel.addWidget(outputs_label)
         outputs_panel.addWidget(self.outputs_list)
@@ -1036,13 +1486,13 @@ class MainWindow(QMainWindow):
         inputs_panel.setContentsMargins(0, 8, 0, 0)
         inputs_label = QLabel('Input Devices')
         inputs_label.setFont(QFont('', 12, QFont.Bold))
-        inputs_label.setStyleSheet('margin-bottom: 8px;')
+        inputs_label.setObjectName('panelHeader')
         self.inputs_list = QListWidget()
         self.inputs_list.setAlternatingRowColors(True)
         self.inputs_list.setSelectionMode(QListWidget.SingleSelection)
         self.inputs_list.setContentsMargins(0, 0, 0, 0)
-        self.inputs_list.setStyleSheet('QListWidget { padding: 8px; }')
-        self.inputs_list.setItemDelegate(RoundedBoxDelegate())
+        self.inputs_list.setObjectName('panelList')
+        self.inputs_list.setItemDelegate(self._list_delegate)
         self.inputs_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.inputs_list.customContextMenuRequested.connect(self.show_input_context_menu)
         inputs_panel.addWidget(inputs_label)
@@ -1066,6 +1516,71 @@ class MainWindow(QMainWindow):
         self._splitter_right.setSizes(layout_state.get('splitter_right', [300, 300]))
 
     def run_pactl(self, args):
+        # Anything other than a query may change server state
+        self.invalidate_pactl_cache()
+        return self._exec_pactl(args)
+
+    def run_pactl_batch(self, commands):
+        """Run independent pactl commands concurrently; returns their outputs in order."""
+        self.invalidate_pactl_cache()
+        procs = [
+            subprocess.Popen(['pactl'] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            for args in commands
+        ]
+        outputs = []
+        for args, proc in zip(commands, procs):
+            stdout, stderr = proc.communicate()
+            if proc.returncode != 0:
+                QMessageBox.warning(self, 'pactl Error', f'Failed to run pactl {args}: {stderr}')
+                stdout = ''
+            outputs.append(stdout)
+        return outputs
+
+    def query_pactl(self, args):
+        """Run a read-only pactl query, reusing a cached result younger than PACTL_CACHE_TTL."""
+        key = tuple(args)
+        now = time.monotonic()
+        if self._cache_fresh(key, now):
+            self._cache_hits += 1
+            return self._pactl_cache[key][1]
+        self._cache_misses += 1
+        output = self._exec_pactl(args)
+        self._pactl_cache[key] = (now, output)
+        return output
+
+    def query_pactl_parsed(self, args, parse):
+        """Return parse(query_pactl(args)), reusing the last result while the output is unchanged.
+
+        The result is shared between callers until the output changes, so they
+        must not modify it (the refresh only annotates streams with 'sink_name')."""
+        output = self.query_pactl(args)
+        key = tuple(args)
+        memo = self._parsed_cache.get(key)
+        if memo is not None and memo[0] == output:
+            return memo[1]
+        result = parse(output)
+        self._parsed_cache[key] = (output, result)
+        return result
+
+    def _cache_fresh(self, key, now):
+        cached = self._pactl_cache.get(key)
+        return cached is not None and now - cached[0] < PACTL_CACHE_TTL
+
+    def invalidate_pactl_cache(self, keys=None):
+        """Drop the given cached queries, or all of them when keys is None."""
+        self._cache_generation += 1
+        if keys is None:
+            self._pactl_cache.clear()
+            self._all_invalidated_at = self._cache_generation
+        else:
+            for key in keys:
+                self._pactl_cache.pop(key, None)
+                self._invalidated_at[key] = self._cache_generation
+
+    def _invalidated_since(self, key, generation):
+        return max(self._invalidated_at.get(key, 0), self._all_invalidated_at) > generation
+
+    def _exec_pactl(self, args):
         try:
             result = subprocess.run(['pactl'] + args, capture_output=True, text=True, check=True)
             return result.stdout
@@ -1074,83 +1589,125 @@ class MainWindow(QMainWindow):
             return ''
 
     def ensure_custom_sinks(self):
-        # Get current sinks
+        # A failed sink query (already reported by _exec_pactl) looks like no
+        # sinks at all; creating them then would duplicate the existing ones.
+        # A working server always lists at least one sink, even a dummy one.
+        if not self.query_pactl(list(self._sinks_query)).strip():
+            return
         sinks = self.get_sinks()
-        existing_sink_names = [sink['name'] for sink in sinks]
-        for sink in CUSTOM_SINKS:
-            if sink not in existing_sink_names:
-                # Create null sink
-                self.run_pactl(['load-module', 'module-null-sink', f'sink_name={sink}', f'sink_properties=device.description={sink}'])
+        existing_sink_names = {sink['name'] for sink in sinks}
+        # Create the missing null sinks in one concurrent batch
+        missing = [sink for sink in CUSTOM_SINKS if sink not in existing_sink_names]
+        if missing:
+            self.run_pactl_batch([
+                ['load-module', 'module-null-sink', f'sink_name={sink}', f'sink_properties=device.description={sink}']
+                for sink in missing
+            ])
 
     def get_input_sources(self):
+        return self.query_pactl_parsed(['list', 'sources'], self._parse_input_sources)
+
+    @staticmethod
+    def _parse_input_sources(output):
         # Uses the top-level Description: field (always present) rather than the
         # nested device.description property, which avoids Properties-block parsing complexity.
-        output = self.run_pactl(['list', 'sources'])
         sources = []
         current = {}
         for line in output.splitlines():
-            line = line.strip()
-            if line.startswith('Source #'):
-                name = current.get('name', '')
-                if name and not name.endswith('.monitor') and not name.startswith('rnnoise_'):
-                    sources.append(current)
+            key, _, value = line.strip().partition(':')
+            if key.startswith('Source #'):
                 current = {}
-            elif line.startswith('Name:'):
-                current['name'] = line.split(':', 1)[1].strip()
-            elif line.startswith('Description:'):
-                current['description'] = line.split(':', 1)[1].strip()
-        name = current.get('name', '')
-        if name and not name.endswith('.monitor') and not name.startswith('rnnoise_'):
-            sources.append(current)
-        for s in sources:
-            s.setdefault('description', s['name'])
-        return sources
+                sources.append(current)
+            elif key == 'Name':
+                current['name'] = value.strip()
+            elif key == 'Description':
+                current['description'] = value.strip()
+        inputs = []
+        for source in sources:
+            name = source.get('name')
+            # Skip sink monitors and our own noise-cancellation sources
+            if not name or name.endswith('.monitor') or name.startswith('rnnoise_'):
+                continue
+            source.setdefault('description', name)
+            inputs.append(source)
+        return inputs
+
+    def _detect_sinks_query(self):
+        """Fall back to the short sink listing when pactl cannot produce JSON."""
+        try:
+            result = subprocess.run(['pactl', *SINKS_JSON_QUERY], capture_output=True, text=True, check=True)
+            _json_loads(result.stdout)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            _log.info('pactl has no JSON output, using the short sink listing')
+            self._sinks_query = SINKS_SHORT_QUERY
+            self._snapshot_queries = tuple(
+                SINKS_SHORT_QUERY if key == SINKS_JSON_QUERY else key for key in SNAPSHOT_QUERIES
+            )
+            return
+        # The probe doubles as the first sink query
+        self._pactl_cache[SINKS_JSON_QUERY] = (time.monotonic(), result.stdout)
 
     def get_sinks(self):
-        # Returns a list of dicts with 'index', 'name', 'description'
-        output = self.run_pactl(['list', 'short', 'sinks'])
-        sinks = []
-        for line in output.strip().split('\n'):
-            if not line:
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                sinks.append({'index': parts[0], 'name': parts[1], 'description': parts[1]})
-        return sinks
+        # Returns a list of dicts with 'index', 'name', 'description'.
+        # JSON output keeps names intact even if they contain tabs.
+        if self._sinks_query == SINKS_JSON_QUERY:
+            return self.query_pactl_parsed(list(SINKS_JSON_QUERY), self._parse_sinks)
+        return self.query_pactl_parsed(list(SINKS_SHORT_QUERY), self._parse_short_sinks)
+
+    @staticmethod
+    def _parse_short_sinks(output):
+        return [
+            {'index': int(m.group(1)), 'name': m.group(2), 'description': m.group(2)}
+            for m in _SHORT_LIST_RE.finditer(output)
+        ]
+
+    @staticmethod
+    def _parse_sinks(output):
+        try:
+            entries = _json_loads(output) if output else []
+        except ValueError:
+            return []
+        return [
+            {'index': entry['index'], 'name': entry['name'], 'description': entry['name']}
+            for entry in entries
+        ]
 
     def get_sink_inputs(self):
         # Returns a list of dicts with 'index', 'name', 'app_name', 'sink'
-        output = self.run_pactl(['list', 'sink-inputs'])
+        return self.query_pactl_parsed(['list', 'sink-inputs'], self._parse_sink_inputs)
+
+    @staticmethod
+    def _parse_sink_inputs(output):
         inputs = []
-        current = {}
-        for line in output.splitlines():
-            line = line.strip()
-            if line.startswith('Sink Input #'):
-                if current:
-                    inputs.append(current)
-                current = {'index': line.split('#')[1].strip()}
-            elif line.startswith('application.name = '):
-                current['app_name'] = line.split('=', 1)[1].strip().strip('"')
-            elif line.startswith('media.name = '):
-                current['media_name'] = line.split('=', 1)[1].strip('"')
-            elif line.startswith('Sink:'):
-                current['sink'] = line.split(':', 1)[1].strip()
-        if current:
-            inputs.append(current)
+        current = None
+        for m in _SINK_INPUT_FIELDS_RE.finditer(output):
+            index, sink, app_name, media_name = m.groups()
+            if index is not None:
+                current = {'index': int(index)}
+                inputs.append(current)
+            elif current is None:
+                continue
+            elif sink is not None:
+                current['sink'] = int(sink)
+            elif app_name is not None:
+                current['app_name'] = app_name
+            else:
+                current['media_name'] = media_name
         return inputs
 
     def get_default_sink_name(self):
         # Get the current default sink name using pactl info
-        output = self.run_pactl(['info'])
-        for line in output.splitlines():
-            if line.startswith('Default Sink:'):
-                return line.split(':', 1)[1].strip()
-        return None
+        return self.query_pactl_parsed(['info'], self._parse_default_sink_name)
+
+    @staticmethod
+    def _parse_default_sink_name(output):
+        m = _DEFAULT_SINK_RE.search(output)
+        return m.group(1).strip() if m else None
 
     def restore_routing_state(self):
         # Restore default sink
         default_sink = self.state.get('default_sink')
-        if default_sink:
+        if default_sink and default_sink != self.get_default_sink_name():
             self.run_pactl(['set-default-sink', default_sink])
         # Restore loopbacks for custom sinks
         if 'loopbacks' in self.state and default_sink:
@@ -1175,13 +1732,20 @@ class MainWindow(QMainWindow):
                         active_sources[mic_name],
                         settings.get('vad_threshold', 50),
                         settings.get('channel_mode', 'mono'),
+                        # The startup refresh follows the restore, and the
+                        # state is written once after the last mic
+                        refresh=False,
+                        save=False,
                     )
                     if mic_name not in self.state.get('noise_cancel', {}):
-                        print(f'[SoundSwitch] Warning: failed to restore NC for {mic_name}')
+                        _log.warning('Failed to restore NC for %s', mic_name)
             for mic_name in to_remove:
                 del self.state['noise_cancel'][mic_name]
-            if to_remove:
+            if len(to_remove) < len(nc_entries):
+                # New module IDs are saved at once (see schedule_save())
                 self.save_state()
+            elif to_remove:
+                self.schedule_save()
 
     def set_default_sink(self):
         selected = self.outputs_list.currentItem()
@@ -1189,13 +1753,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, 'No Selection', 'Please select a sink to set as default.')
             return
         sink_name = selected.text().replace(' (default)', '').strip()
-        self.run_pactl(['set-default-sink', sink_name])
+        if sink_name != self.get_default_sink_name():
+            self.run_pactl(['set-default-sink', sink_name])
         self.state['default_sink'] = sink_name
         self.setup_custom_sink_loopbacks(sink_name)
-        self.refresh_devices_and_sinks(force=True)
+        self.schedule_refresh()
         QMessageBox.information(self, 'Default Sink', f'Set {sink_name} as the default output device and routed custom sinks to it.')
 
-    def enable_noise_cancellation(self, mic_name, mic_description, vad_threshold, channel_mode):
+    def enable_noise_cancellation(self, mic_name, mic_description, vad_threshold, channel_mode, refresh=True, save=True):
         safe_id = _safe_mic_id(mic_name)
         label = 'noise_suppressor_mono' if channel_mode == 'mono' else 'noise_suppressor_stereo'
         friendly_desc = f'{mic_description} (Noise Cancelled)'
@@ -1271,80 +1836,111 @@ class MainWindow(QMainWindow):
             'settings': {'vad_threshold': vad_threshold, 'channel_mode': channel_mode},
             'virtual_source': friendly_desc,
         }
-        self.save_state()
+        if save:
+            self.save_state()
         self.show_status(f'Noise cancellation enabled: {friendly_desc}')
-        self.refresh_devices_and_sinks(force=True)
+        if refresh:
+            self.schedule_refresh()
 
     def disable_noise_cancellation(self, mic_name, keep_settings=False):
         nc = self.state.get('noise_cancel', {}).get(mic_name)
         if not nc:
             return
-        for mod_id in reversed(nc['modules']):
-            self.run_pactl(['unload-module', str(mod_id)])
+        # The chain is torn down in order, so this cannot run concurrently
+        self.unload_modules(reversed(nc['modules']))
         if keep_settings:
             self.state['noise_cancel'][mic_name]['modules'] = []
         else:
             del self.state['noise_cancel'][mic_name]
             self.show_status('Noise cancellation disabled.')
         self.save_state()
-        self.refresh_devices_and_sinks(force=True)
+        self.schedule_refresh()
 
     def setup_custom_sink_loopbacks(self, hardware_sink_name):
         # Track loopback module IDs in self.state['loopbacks']
         if 'loopbacks' not in self.state:
             self.state['loopbacks'] = {}
-        # Get all loaded modules
-        modules = self.get_loaded_modules()
-        # Remove previous loopbacks for our custom sinks
+        # Nothing to do if every custom sink already has a live loopback to this
+        # sink; ids get reused across sound server restarts, so each one is
+        # checked against the loaded module's own arguments
+        current = [(custom_sink, self.state['loopbacks'].get(custom_sink)) for custom_sink in CUSTOM_SINKS]
+        if all(mods and all(mod.get('sink') == hardware_sink_name for mod in mods.values()) for _, mods in current):
+            modules = self.get_loaded_modules()
+            if all(
+                self._is_loopback(modules.get(int(mod_id)), f'{custom_sink}.monitor', hardware_sink_name)
+                for custom_sink, mods in current for mod_id in mods
+            ):
+                return
+        # Remove previous loopbacks for our custom sinks; they are independent
+        # of each other, so they are unloaded in one concurrent batch
+        self.unload_modules(
+            [mod_id for custom_sink in CUSTOM_SINKS for mod_id in self.state['loopbacks'].get(custom_sink, {})],
+            concurrent=True,
+        )
         for custom_sink in CUSTOM_SINKS:
-            # Remove any loopback from custom_sink.monitor to any sink
-            for mod_id, mod_info in list(self.state['loopbacks'].get(custom_sink, {}).items()):
-                if self.is_module_loaded(mod_id, modules):
-                    self.run_pactl(['unload-module', str(mod_id)])
             self.state['loopbacks'][custom_sink] = {}
-        # Create new loopbacks from each custom sink's monitor to the selected hardware sink
-        for custom_sink in CUSTOM_SINKS:
-            source = f'{custom_sink}.monitor'
-            sink = hardware_sink_name
-            # Load loopback
-            out = self.run_pactl(['load-module', 'module-loopback', f'source={source}', f'sink={sink}'])
+        # Create new loopbacks from each custom sink's monitor to the selected
+        # hardware sink, loading all of them in one concurrent batch
+        sink = hardware_sink_name
+        outputs = self.run_pactl_batch([
+            ['load-module', 'module-loopback', f'source={custom_sink}.monitor', f'sink={sink}']
+            for custom_sink in CUSTOM_SINKS
+        ])
+        for custom_sink, out in zip(CUSTOM_SINKS, outputs):
             try:
                 mod_id = int(out.strip())
-                self.state['loopbacks'][custom_sink][mod_id] = {'source': source, 'sink': sink}
-            except Exception:
-                pass
+            except ValueError:
+                continue
+            self.state['loopbacks'][custom_sink][mod_id] = {'source': f'{custom_sink}.monitor', 'sink': sink}
         self.save_state()
 
+    def unload_modules(self, mod_ids, concurrent=False):
+        """Unload the given modules, skipping any that are no longer loaded."""
+        modules = self.get_loaded_modules()
+        commands = [['unload-module', str(mod_id)] for mod_id in mod_ids if self.is_module_loaded(mod_id, modules)]
+        if not commands:
+            return
+        if concurrent:
+            self.run_pactl_batch(commands)
+        else:
+            for args in commands:
+                self.run_pactl(args)
+
     def get_loaded_modules(self):
-        output = self.run_pactl(['list', 'short', 'modules'])
-        modules = {}
-        for line in output.strip().split('\n'):
-            if not line:
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                modules[parts[0]] = parts[1]
-        return modules
+        return self.query_pactl_parsed(['list', 'short', 'modules'], self._parse_loaded_modules)
+
+    @staticmethod
+    def _parse_loaded_modules(output):
+        # Module id -> (name, arguments)
+        return {int(m.group(1)): (m.group(2), m.group(3) or '') for m in _SHORT_MODULES_RE.finditer(output)}
+
+    @staticmethod
+    def _is_loopback(module, source, sink):
+        """True if module, a (name, arguments) pair, is a loopback from source to sink."""
+        if module is None or module[0] != 'module-loopback':
+            return False
+        args = set(module[1].split())
+        return f'source={source}' in args and f'sink={sink}' in args
 
     def is_module_loaded(self, mod_id, modules):
-        return str(mod_id) in modules
+        # Module ids persisted in the JSON state come back as strings
+        return int(mod_id) in modules
 
     def update_hidden_streams(self, sink_inputs):
         # Hide loopback streams created by this app (by property or app name)
-        loopback_indices = set()
-        for stream in sink_inputs:
-            app_name = stream.get('app_name', '').lower()
-            media_name = stream.get('media_name', '').lower()
-            # Heuristic: hide if app_name is 'pipewire', 'pulseaudio', or media_name contains 'loopback'
-            if 'loopback' in media_name or app_name in {'pipewire', 'pulseaudio'}:
-                loopback_indices.add(stream['index'])
+        # Heuristic: hide if app_name is 'pipewire', 'pulseaudio', or media_name contains 'loopback'
+        loopback_indices = {
+            stream['index'] for stream in sink_inputs
+            if stream.get('app_name', '').lower() in _LOOPBACK_APP_NAMES
+            or 'loopback' in stream.get('media_name', '').lower()
+        }
         # Also hide any indices tracked in state['loopbacks']
-        if 'loopbacks' in self.state:
-            for sink_loopbacks in self.state['loopbacks'].values():
-                for mod in sink_loopbacks.values():
-                    idx = mod.get('stream_index')
-                    if idx:
-                        loopback_indices.add(str(idx))
+        loopback_indices.update(
+            int(mod['stream_index'])
+            for sink_loopbacks in self.state.get('loopbacks', {}).values()
+            for mod in sink_loopbacks.values()
+            if mod.get('stream_index')
+        )
         self.hidden_streams = loopback_indices
 
     def add_rule_from_ui(self):
@@ -1354,45 +1950,54 @@ class MainWindow(QMainWindow):
             self.show_status('App name required for rule.', error=True)
             return
         self.state['rules'].append({'app_name': app_name, 'sink': sink})
-        self.save_state()
+        self._rule_map = None
+        self.schedule_save()
         self.refresh_rules_list()
         self.rule_app_input.clear()
         self.apply_routing_rules()
-
-    def apply_routing_rules(self):
-        sinks = self.get_sinks()
-        sink_inputs = self.get_sink_inputs()
-        self.update_hidden_streams(sink_inputs)
+        self._burst_poll_interval()
+
+    def apply_routing_rules(self, sinks=None, sink_inputs=None):
+        """Move streams that match a rule; callers that already hold the sinks and streams pass them in."""
+        if self._rule_map is None:
+            # Lower-cased app name -> target sink; a later rule for the same app wins
+            self._rule_map = {rule['app_name'].lower(): rule['sink'] for rule in self.state.get('rules', [])}
+        rule_map = self._rule_map
+        if not rule_map:
+            # Nothing to route; the refresh updates the status bar itself
+            return
+        if sinks is None:
+            sinks = self.get_sinks()
+        if sink_inputs is None:
+            sink_inputs = self.get_sink_inputs()
+            self.update_hidden_streams(sink_inputs)
         sink_index_to_name = {sink['index']: sink['name'] for sink in sinks}
-        for rule in self.state.get('rules', []):
-            for stream in sink_inputs:
-                if stream['index'] in self.hidden_streams:
-                    continue
-                # Skip if manual override exists and matches current sink
-                if str(stream['index']) in self.state.get('manual_overrides', {}):
-                    if self.state['manual_overrides'][str(stream['index'])] == stream.get('sink_name'):
-                        continue
-                sink_index = stream.get('sink', None)
-                sink_name = sink_index_to_name.get(sink_index, 'Unknown') if sink_index else 'Unknown'
-                if stream.get('app_name', '').lower() == rule['app_name'].lower() and sink_name != rule['sink']:
-                    self.run_pactl(['move-sink-input', str(stream['index']), rule['sink']])
-                    self.show_status(f"Auto-moved {stream['app_name']} (#{stream['index']}) to {rule['sink']}")
+        overrides = self.state.get('manual_overrides', {})
+        for stream in sink_inputs:
+            rule_sink = rule_map.get(stream.get('app_name', '').lower())
+            if rule_sink is None or stream['index'] in self.hidden_streams:
+                continue
+            # Skip if manual override exists and matches current sink
+            if stream['index'] in overrides and overrides[stream['index']] == stream.get('sink_name'):
+                continue
+            sink_name = sink_index_to_name.get(stream.get('sink'), 'Unknown')
+            if sink_name != rule_sink:
+                self.run_pactl(['move-sink-input', str(stream['index']), rule_sink])
+                self.show_status(f"Auto-moved {stream['app_name']} (#{stream['index']}) to {rule_sink}")
         
         # Update status bar after applying rules
-        self.update_status_bar()
+        self.update_status_bar(sinks, sink_inputs)
 
     def remove_selected_rule(self):
-        row = self.rules_list.currentRow()
+        row = self.rules_list.currentIndex().row()
         if row >= 0 and row < len(self.state['rules']):
             del self.state['rules'][row]
-            self.save_state()
+            self._rule_map = None
+            self.schedule_save()
             self.refresh_rules_list()
 
     def refresh_rules_list(self):
-        self.rules_list.clear()
-        for rule in self.state['rules']:
-            item = QListWidgetItem(f"If app is '{rule['app_name']}' → {rule['sink']}")
-            self.rules_list.addItem(item)
+        self._rules_model.set_rules(self.state['rules'])
 
     def show_stream_context_menu(self, pos):
         item = self.devices_list.itemAt(pos)
@@ -1439,11 +2044,7 @@ class MainWindow(QMainWindow):
         )
 
     def open_noise_cancel_dialog(self, mic_name):
-        sources = self.get_input_sources()
-        mic_description = next(
-            (s['description'] for s in sources if s['name'] == mic_name),
-            mic_name,
-        )
+        mic_description = self._input_source_descriptions.get(mic_name, mic_name)
         current_settings = self.state.get('noise_cancel', {}).get(mic_name, {}).get('settings')
         dlg = NoiseCancelDialog(mic_name, mic_description, current_settings, parent=self)
         if dlg.exec_() == QDialog.Accepted:
@@ -1453,149 +2054,231 @@ class MainWindow(QMainWindow):
     def reset_manual_override(self, stream_index):
         if stream_index in self.state['manual_overrides']:
             del self.state['manual_overrides'][stream_index]
-            self.save_state()
-            self.refresh_devices_and_sinks(force=True)
+            self.schedule_save()
+            self.schedule_refresh()
             self.show_status(f'Reset manual override for stream #{stream_index}')
 
+    def schedule_refresh(self):
+        """Rebuild the panels once the current burst of user actions settles."""
+        self._ui_refresh_timer.start()
+        self._burst_poll_interval()
+
+    def _on_refresh_clicked(self):
+        # A manual refresh recovers from missed events, so skip the query cache
+        self.invalidate_pactl_cache()
+        self.refresh_devices_and_sinks(force=True)
+
     def refresh_devices_and_sinks(self, force=False):
         if not force:
             return
-        self.devices_list.clear()
-        self.outputs_list.clear()
-        for sink_list in getattr(self, 'sink_lists', {}).values():
-            sink_list.clear()
+        if not self.isVisible():
+            # Nobody can see the panels; keep routing streams and rebuild on show
+            self._panels_stale = True
+            self._route_streams()
+            return
+        self._panels_stale = False
+        self._refresh_panels()
+
+    def _route_streams(self):
+        """Apply the routing rules without touching the panels.
+
+        Shared by the hidden and visible refresh paths; returns the sinks and
+        the streams, each tagged with its 'sink_name'."""
         sinks = self.get_sinks()
         sink_inputs = self.get_sink_inputs()
         self.update_hidden_streams(sink_inputs)
         sink_index_to_name = {sink['index']: sink['name'] for sink in sinks}
-        sink_map = {sink['name']: [] for sink in sinks}
         for stream in sink_inputs:
-            sink_index = stream.get('sink', None)
-            sink_name = sink_index_to_name.get(sink_index, 'Unknown') if sink_index else 'Unknown'
-            if sink_name in sink_map:
-                sink_map[sink_name].append(stream)
-            stream['sink_name'] = sink_name
-        # Clean up manual overrides for streams that no longer exist
-        current_indices = {str(s['index']) for s in sink_inputs}
-        to_remove = [idx for idx in self.state['manual_overrides'] if idx not in current_indices]
-        for idx in to_remove:
+            stream['sink_name'] = sink_index_to_name.get(stream.get('sink'), 'Unknown')
+        self._prune_manual_overrides({stream['index'] for stream in sink_inputs})
+        self.apply_routing_rules(sinks, sink_inputs)
+        return sinks, sink_inputs
+
+    def _prune_manual_overrides(self, current_indices):
+        """Drop manual overrides for streams that no longer exist."""
+        stale = self.state['manual_overrides'].keys() - current_indices
+        for idx in stale:
             del self.state['manual_overrides'][idx]
-        self.save_state()
-        # Auto-routing logic
-        self.apply_routing_rules()
+        if stale:
+            self.schedule_save()
+
+    def _refresh_panels(self):
+        sinks, sink_inputs = self._route_streams()
+        sink_map = defaultdict(list)  # sink name -> visible streams on it
+        # Streams that are not hidden, in order, split out in the same pass
+        visible_streams = []
+        for stream in sink_inputs:
+            if stream['index'] in self.hidden_streams:
+                continue
+            visible_streams.append(stream)
+            sink_map[stream['sink_name']].append(stream)
         # Application Streams panel: show current sink for each stream, skip hidden and rnnoise_ internal streams
-        for i, stream in enumerate([s for s in sink_inputs
-                                     if s['index'] not in self.hidden_streams
-                                     and not s.get('sink_name', '').startswith('rnnoise_')]):
+        stream_rows = []
+        for i, stream in enumerate(s for s in visible_streams if not s['sink_name'].startswith('rnnoise_')):
             main_label = f"{stream.get('app_name', 'Unknown App')} (#{stream['index']}) - {stream.get('sink_name', 'Unknown')}"
             sub_label = stream.get('media_name', '')
-            item = QListWidgetItem()
-            item.setData(Qt.DisplayRole, main_label)
-            item.setData(Qt.UserRole + 1, {'main': main_label, 'sub': sub_label})
-            item.setData(Qt.ItemDataRole.UserRole, stream['index'])
-            item.setToolTip(f"App: {stream.get('app_name', 'Unknown App')}\nSink: {stream.get('sink_name', 'Unknown')}\nMedia: {stream.get('media_name', '')}")
-            # Dark alternating row colors
-            if i % 2 == 0:
-                item.setBackground(QBrush(QColor('#232629')))
-            else:
-                item.setBackground(QBrush(QColor('#2d2f31')))
-            self.devices_list.addItem(item)
-        # Sinks panel: show each sink's streams in its own list, skip hidden streams
+            stream_rows.append((stream['index'], {
+                Qt.DisplayRole: main_label,
+                Qt.UserRole + 1: {'main': main_label, 'sub': sub_label},
+                Qt.ItemDataRole.UserRole: stream['index'],
+                MIME_PAYLOAD_ROLE: str(stream['index']).encode(),
+                Qt.ToolTipRole: f"App: {stream.get('app_name', 'Unknown App')}\nSink: {stream.get('sink_name', 'Unknown')}\nMedia: {stream.get('media_name', '')}",
+                # Dark alternating row colors
+                Qt.BackgroundRole: BRUSH_EVEN if i % 2 == 0 else BRUSH_ODD,
+            }))
+        self._sync_list_items(self.devices_list, stream_rows)
+        # Sinks panel: show each sink's (visible) streams in its own list
         for sink in CUSTOM_SINKS:
             sink_list = self.sink_lists[sink]
-            sink_list.clear()
-            streams = [s for s in sink_map.get(sink, []) if s['index'] not in self.hidden_streams]
-            for j, stream in enumerate(streams):
+            sink_rows = []
+            for j, stream in enumerate(sink_map.get(sink, ())):
                 main_label = f"{stream.get('app_name', 'Unknown App')} (#{stream['index']})"
                 sub_label = stream.get('media_name', '')
-                stream_item = QListWidgetItem()
-                stream_item.setData(Qt.DisplayRole, main_label)
-                stream_item.setData(Qt.UserRole + 1, {'main': main_label, 'sub': sub_label})
-                stream_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                stream_item.setToolTip(f"App: {stream.get('app_name', 'Unknown App')}\nMedia: {stream.get('media_name', '')}")
-                # Dark alternating row colors
-                if j % 2 == 0:
-                    stream_item.setBackground(QBrush(QColor('#232629')))
-                else:
-                    stream_item.setBackground(QBrush(QColor('#2d2f31')))
-                sink_list.addItem(stream_item)
-            # Placeholder for empty list
-            if sink_list.count() == 0:
-                placeholder = QListWidgetItem('(No streams)')
-                placeholder.setFlags(Qt.NoItemFlags)
-                placeholder.setForeground(QBrush(QColor('#555')))
-                sink_list.addItem(placeholder)
+                sink_rows.append((stream['index'], {
+                    Qt.DisplayRole: main_label,
+                    Qt.UserRole + 1: {'main': main_label, 'sub': sub_label},
+                    Qt.ToolTipRole: f"App: {stream.get('app_name', 'Unknown App')}\nMedia: {stream.get('media_name', '')}",
+                    # Dark alternating row colors
+                    Qt.BackgroundRole: BRUSH_EVEN if j % 2 == 0 else BRUSH_ODD,
+                }))
+            if sink_rows:
+                self._sync_list_items(sink_list, sink_rows, flags=Qt.ItemFlag.ItemIsEnabled)
+            else:
+                # Placeholder for empty list
+                self._sync_list_items(sink_list, [(None, {
+                    Qt.DisplayRole: '(No streams)',
+                    Qt.ForegroundRole: BRUSH_PLACEHOLDER,
+                })], flags=Qt.NoItemFlags)
         # Outputs panel: show all sinks (hardware and custom), highlight default, skip hidden sinks
-        if hasattr(self, 'outputs_delegate'):
-            self.outputs_delegate.default_sink_name = self.get_default_sink_name()
+        default_sink = self.get_default_sink_name()
+        self.outputs_delegate.default_sink_name = default_sink
+        output_rows = []
         for i, sink in enumerate([s for s in sinks if s['name'] not in self.hidden_sinks and not s['name'].startswith('rnnoise_')]):
             name = sink['name']
-            label = f"{name}"
-            if name == self.get_default_sink_name():
-                label += " (default)"
-            item = QListWidgetItem(label)
-            if name == self.get_default_sink_name():
-                item.setFont(QFont('', 10, QFont.Bold))
-                item.setForeground(QBrush(QColor('#00bfff')))
-            item.setToolTip(f"Sink: {name}")
-            # Dark alternating row colors
-            if i % 2 == 0:
-                item.setBackground(QBrush(QColor('#232629')))
-            else:
-                item.setBackground(QBrush(QColor('#2d2f31')))
-            self.outputs_list.addItem(item)
+            is_default = name == default_sink
+            output_rows.append((name, {
+                Qt.DisplayRole: f"{name} (default)" if is_default else name,
+                Qt.FontRole: self._default_output_font if is_default else None,
+                Qt.ForegroundRole: BRUSH_ACCENT if is_default else None,
+                Qt.ToolTipRole: f"Sink: {name}",
+                # Dark alternating row colors
+                Qt.BackgroundRole: BRUSH_EVEN if i % 2 == 0 else BRUSH_ODD,
+            }))
+        self._sync_list_items(self.outputs_list, output_rows)
         # Input Devices panel
-        self.inputs_list.clear()
         input_sources = self.get_input_sources()
-        if input_sources:
-            nc_state = self.state.get('noise_cancel', {})
-            for i, source in enumerate(input_sources):
-                mic_name = source['name']
-                label = source['description']
-                bg = QColor('#232629') if i % 2 == 0 else QColor('#2d2f31')
-                nc_active = bool(nc_state.get(mic_name, {}).get('modules'))
-                display = f'[NC] {label}' if nc_active else label
-                item = QListWidgetItem(display)
-                item.setData(Qt.ItemDataRole.UserRole, mic_name)
-                item.setBackground(QBrush(bg))
-                if nc_active:
-                    item.setForeground(QBrush(QColor('#00bfff')))
-                self.inputs_list.addItem(item)
-                if nc_active:
-                    virtual_source = nc_state[mic_name].get('virtual_source', '')
-                    sub = QListWidgetItem(f'        ↳ {virtual_source}')
-                    sub.setFlags(Qt.NoItemFlags)
-                    sub.setBackground(QBrush(bg))
-                    sub.setForeground(QBrush(QColor('#888')))
-                    sub.setFont(self._italic_font())
-                    self.inputs_list.addItem(sub)
-        else:
-            placeholder = QListWidgetItem('(No microphones found)')
-            placeholder.setFlags(Qt.NoItemFlags)
-            placeholder.setForeground(QBrush(QColor('#555')))
-            self.inputs_list.addItem(placeholder)
+        self._input_source_descriptions = {s['name']: s['description'] for s in input_sources}
+        input_rows = []
+        nc_state = self.state.get('noise_cancel', {})
+        for i, source in enumerate(input_sources):
+            mic_name = source['name']
+            label = source['description']
+            bg = BRUSH_EVEN if i % 2 == 0 else BRUSH_ODD
+            nc = nc_state.get(mic_name)
+            nc_active = bool(nc and nc.get('modules'))
+            input_rows.append((mic_name, {
+                Qt.DisplayRole: f'[NC] {label}' if nc_active else label,
+                Qt.ItemDataRole.UserRole: mic_name,
+                Qt.BackgroundRole: bg,
+                Qt.ForegroundRole: BRUSH_ACCENT if nc_active else None,
+            }))
+            if nc_active:
+                virtual_source = nc.get('virtual_source', '')
+                input_rows.append((('nc', mic_name), {
+                    Qt.DisplayRole: f'        ↳ {virtual_source}',
+                    Qt.BackgroundRole: bg,
+                    Qt.ForegroundRole: BRUSH_DIM,
+                    Qt.FontRole: self._nc_source_font,
+                }, Qt.NoItemFlags))
+        if not input_rows:
+            input_rows.append((None, {
+                Qt.DisplayRole: '(No microphones found)',
+                Qt.ForegroundRole: BRUSH_PLACEHOLDER,
+            }, Qt.NoItemFlags))
+        self._sync_list_items(self.inputs_list, input_rows)
 
         # Refresh rules list
         self.refresh_rules_list()
 
         # Update status bar
-        self.update_status_bar()
+        self.update_status_bar(sinks, sink_inputs, default_sink)
+
+    def _sync_list_items(self, list_widget, rows, flags=None):
+        """Update list_widget in place to show rows, a list of (key, {role: value}) pairs.
+
+        Items are matched by key, so rows that did not change are left untouched
+        instead of being destroyed and recreated on every refresh. New items get
+        flags, if given; a row may override them with a third tuple element."""
+        items = self._list_items.setdefault(list_widget, {})
+        new_keys = {row[0] for row in rows}
+        # QListWidget.row() is a linear search, so stale rows are found in one
+        # reverse sweep against a set rather than one row() call per item
+        stale_items = [items.pop(key)[0] for key in [k for k in items if k not in new_keys]]
+        if stale_items:
+            stale = {id(item) for item in stale_items}
+            for row in range(list_widget.count() - 1, -1, -1):
+                if id(list_widget.item(row)) in stale:
+                    list_widget.takeItem(row)
+        for row, (key, data, *row_flags) in enumerate(rows):
+            entry = items.get(key)
+            if entry is None:
+                item = QListWidgetItem()
+                item_flags = row_flags[0] if row_flags else flags
+                if item_flags is not None:
+                    item.setFlags(item_flags)
+                list_widget.insertItem(row, item)
+            else:
+                item, old_data = entry
+                if list_widget.item(row) is not item:
+                    list_widget.takeItem(list_widget.row(item))
+                    list_widget.insertItem(row, item)
+                if old_data == data:
+                    continue
+            for role, value in data.items():
+                item.setData(role, value)
+            items[key] = (item, data)
 
     def load_state(self):
         if os.path.exists(STATE_FILE):
             try:
-                with open(STATE_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
+                with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                    return _json_loads(f.read())
+            except (OSError, ValueError) as e:
+                # ValueError covers JSON errors from either decoder and bad UTF-8
                 QMessageBox.warning(self, 'Error', f'Failed to load state: {e}')
         return {}
 
+    def schedule_save(self):
+        """Write the state once no further changes arrive for STATE_SAVE_DELAY_MS.
+
+        Used for frequent, cheap-to-lose changes such as drops, rule edits and
+        OSD settings; real_close() and aboutToQuit flush anything still pending.
+        Module IDs (loopbacks, noise cancellation) are still saved at once so a
+        crash cannot orphan loaded modules."""
+        self._save_timer.start()
+
     def save_state(self):
+        """Serialise the state now and hand the write to the state write pool."""
+        self._save_timer.stop()
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
-        except Exception as e:
+            data = _json_dumps_state(self.state)
+        except TypeError as e:
             QMessageBox.warning(self, 'Error', f'Failed to save state: {e}')
+            return
+        if data == self._saved_state:
+            return
+        self._saved_state = data
+        self._state_write_pool.start(StateWriter(STATE_FILE, data, self._state_write_notifier))
+
+    def flush_state(self):
+        """Save any pending change and wait until it is on disk."""
+        self.save_state()
+        self._state_write_pool.waitForDone()
+
+    def _on_state_write_failed(self, error):
+        # Forget what was written so the next save retries
+        self._saved_state = None
+        QMessageBox.warning(self, 'Error', f'Failed to save state: {error}')
 
     def init_tray_icon(self):
         icon = create_app_icon()
@@ -1644,6 +2327,11 @@ class MainWindow(QMainWindow):
             else:
                 self.hide_to_tray()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._panels_stale:
+            self.refresh_devices_and_sinks(force=True)
+
     def changeEvent(self, event):
         if event.type() == QtCore.QEvent.WindowStateChange and self.isMinimized():
             QTimer.singleShot(0, self.hide_to_tray)
@@ -1666,9 +2354,12 @@ class MainWindow(QMainWindow):
             'splitter_center': list(self._splitter_center.sizes()),
             'splitter_right':  list(self._splitter_right.sizes()),
         }
-        self.save_state()
-        if hasattr(self, '_shortcuts_manager'):
-            self._shortcuts_manager.stop()
+        self.flush_state()
+        self._shortcuts_manager.stop()
+        if self._pactl_monitor is not None:
+            self._pactl_monitor.finished.disconnect(self._on_pactl_monitor_finished)
+            self._pactl_monitor.kill()
+            self._pactl_monitor.waitForFinished(1000)
         if self.tray_icon:
             self.tray_icon.hide()
         QApplication.instance().quit()
@@ -1684,12 +2375,12 @@ class MainWindow(QMainWindow):
         result = self.run_pactl(['move-sink-input', str(sink_input_index), sink_name])
         if result is not None:
             # Track manual override
-            self.state.setdefault('manual_overrides', {})[str(sink_input_index)] = sink_name
-            self.save_state()
+            self.state.setdefault('manual_overrides', {})[sink_input_index] = sink_name
+            self.schedule_save()
             self.show_status(f'Moved stream #{sink_input_index} to sink {sink_name}')
         else:
             self.show_status(f'Failed to move stream #{sink_input_index} to sink {sink_name}', error=True)
-        self.refresh_devices_and_sinks(force=True)
+        self.schedule_refresh()
 
     def get_sink_volume(self, sink_name):
         """Return current volume of a sink as an integer 0-100, or None on failure."""
@@ -1698,11 +2389,11 @@ class MainWindow(QMainWindow):
                 ['pactl', 'get-sink-volume', sink_name],
                 capture_output=True, text=True, check=True,
             )
-            match = re.search(r'(\d+)%', result.stdout)
-            if match:
-                return int(match.group(1))
-        except Exception:
-            pass
+        except (subprocess.CalledProcessError, OSError):
+            return None
+        match = _VOLUME_PERCENT_RE.search(result.stdout)
+        if match:
+            return int(match.group(1))
         return None
 
     def set_sink_volume(self, sink_name, direction):
@@ -1720,10 +2411,9 @@ class MainWindow(QMainWindow):
             )
 
     def _on_shortcut_activated(self, shortcut_id):
-        parts = shortcut_id.rsplit('_', 1)
-        if len(parts) != 2:
+        sink_name, sep, direction = shortcut_id.rpartition('_')
+        if not sep:
             return
-        sink_name, direction = parts
         if sink_name not in CUSTOM_SINKS or direction not in ('up', 'down'):
             return
         self.set_sink_volume(sink_name, direction)
@@ -1747,7 +2437,7 @@ class MainWindow(QMainWindow):
 
     def open_osd_settings(self):
         def on_apply():
-            self.save_state()
+            self.schedule_save()
         OSDSettingsDialog(self.state, on_apply, parent=self).exec_()
 
     def open_settings(self):
@@ -1758,6 +2448,10 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--minimized', action='store_true', help='Start minimized to tray')
     args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get('SOUNDSWITCH_DEBUG') else logging.WARNING,
+        format='[SoundSwitch] %(levelname)s: %(message)s',
+    )
     app = QApplication(sys.argv)
     window = MainWindow(start_minimized=args.minimized)
     if not args.minimized: